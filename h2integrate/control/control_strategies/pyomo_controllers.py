@@ -108,6 +108,10 @@ class PyomoControllerBaseClass(ControllerBaseClass):
         # get technology group name
         self.tech_group_name = self.pathname.split(".")
 
+        # get the starting index for each control window
+        self.n_timesteps = self.options["plant_config"]["plant"]["simulation"]["n_timesteps"]
+        self.window_start_indices = range(0, self.n_timesteps, self.config.n_control_window)
+
         # create inputs for all pyomo object creation functions from all connected technologies
         self.dispatch_connections = self.options["plant_config"]["tech_to_dispatch_connections"]
         for connection in self.dispatch_connections:
@@ -233,13 +237,10 @@ class PyomoControllerBaseClass(ControllerBaseClass):
             unused_commodity = np.zeros(self.n_timesteps)
             soc = np.zeros(self.n_timesteps)
 
-            # get the starting index for each control window
-            window_start_indices = list(range(0, self.n_timesteps, self.config.n_control_window))
-
             control_strategy = self.options["tech_config"]["control_strategy"]["model"]
 
             # loop over all control windows, where t is the starting index of each window
-            for t in window_start_indices:
+            for t in self.window_start_indices:
                 self.update_time_series_parameters()
                 # get the inputs over the current control window
                 commodity_in = inputs[self.config.commodity_name + "_in"][
@@ -272,22 +273,15 @@ class PyomoControllerBaseClass(ControllerBaseClass):
                     sim_start_index=t,
                 )
 
-                # get a list of all time indices belonging to the current control window
-                window_indices = list(range(t, t + self.config.n_control_window))
-
-                # loop over all time steps in the current control window
-                for j in window_indices:
-                    # save the output for the control window to the output for the full
-                    # simulation
-                    storage_commodity_out[j] = storage_commodity_out_control_window[j - t]
-                    soc[j] = soc_control_window[j - t]
-                    total_commodity_out[j] = np.minimum(
-                        demand_in[j - t], storage_commodity_out[j] + commodity_in[j - t]
-                    )
-                    unmet_demand[j] = np.maximum(0, demand_in[j - t] - total_commodity_out[j])
-                    unused_commodity[j] = np.maximum(
-                        0, storage_commodity_out[j] + commodity_in[j - t] - demand_in[j - t]
-                    )
+                # save the output for the control window to the output for the full simulation
+                window = slice(t, t + self.config.n_control_window)
+                storage_commodity_out[window] = storage_commodity_out_control_window
+                soc[window] = soc_control_window
+
+                available_commodity = storage_commodity_out[window] + commodity_in
+                total_commodity_out[window] = np.minimum(demand_in, available_commodity)
+                unmet_demand[window] = np.maximum(0, demand_in - total_commodity_out[window])
+                unused_commodity[window] = np.maximum(0, available_commodity - demand_in)
 
             return total_commodity_out, storage_commodity_out, unmet_demand, unused_commodity, soc
 
@@ -433,36 +427,36 @@ class SimpleBatteryControllerHeuristic(PyomoControllerBaseClass):
         NOTE: This method assumes that storage cannot be charged by the grid.
 
         """
-        for t in self.blocks.index_set():
-            self.max_charge_fraction[t] = self.enforce_power_fraction_simple_bounds(
-                (commodity_in[t]) / self.maximum_storage, self.minimum_soc, self.maximum_soc
-            )
-            self.max_discharge_fraction[t] = self.enforce_power_fraction_simple_bounds(
-                (system_commodity_interface_limit[t] - commodity_in[t]) / self.maximum_storage,
-                self.minimum_soc,
-                self.maximum_soc,
-            )
+        commodity_in = np.asarray(commodity_in)
+        system_commodity_interface_limit = np.asarray(system_commodity_interface_limit)
+
+        self.max_charge_fraction = self.enforce_power_fraction_simple_bounds(
+            commodity_in / self.maximum_storage, self.minimum_soc, self.maximum_soc
+        )
+        self.max_discharge_fraction = self.enforce_power_fraction_simple_bounds(
+            (system_commodity_interface_limit - commodity_in) / self.maximum_storage,
+            self.minimum_soc,
+            self.maximum_soc,
+        )
 
     @staticmethod
     def enforce_power_fraction_simple_bounds(
-        storage_fraction: float,
+        storage_fraction: float | np.ndarray,
         minimum_soc: float,
         maximum_soc: float,
-    ) -> float:
-        """Enforces simple bounds (0, .9) for battery power fractions.
+    ) -> float | np.ndarray:
+        """Enforces simple bounds (minimum_soc, maximum_soc) for battery power fractions.
 
         Args:
-            storage_fraction (float): Storage fraction from heuristic method.
+            storage_fraction (float | np.ndarray): Storage fraction(s) from heuristic method.
+            minimum_soc (float): Lower bound of the storage fraction.
+            maximum_soc (float): Upper bound of the storage fraction.
 
         Returns:
-            storage_fraction (float): Bounded storage fraction.
+            storage_fraction (float | np.ndarray): Bounded storage fraction(s).
 
         """
-        if storage_fraction > maximum_soc:
-            storage_fraction = maximum_soc
-        elif storage_fraction < minimum_soc:
-            storage_fraction = minimum_soc
-        return storage_fraction
+        return np.clip(storage_fraction, minimum_soc, maximum_soc)
 
     def update_soc(self, storage_fraction: float, soc0: float) -> float:
         """Updates SOC based on storage fraction threshold.
@@ -700,8 +694,6 @@ class HeuristicLoadFollowingController(SimpleBatteryControllerHeuristic):
             merge_shared_inputs(self.options["tech_config"]["model_inputs"], "control")
         )
 
-        self.n_timesteps = self.options["plant_config"]["plant"]["simulation"]["n_timesteps"]
-
         super().setup()
 
         if self.config.charge_efficiency is not None:
@@ -186,6 +186,10 @@ class SimpleAmmoniaCostModel(CostModelBaseClass):
         # Inline the run_ammonia_cost_model logic
         model_year_CEPCI = 816.0  # 2022
         equation_year_CEPCI = 541.7  # 2016
+        cepci_ratio = model_year_CEPCI / equation_year_CEPCI
+
+        # annual ammonia production [kg/year], used for all feedstock and byproduct costs
+        ammonia_production_kgpy = config.plant_capacity_kgpy * config.plant_capacity_factor
 
         # scale with respect to a baseline plant (What is this?)
         scaling_ratio = config.plant_capacity_kgpy / (365.0 * 1266638.4)
@@ -193,13 +197,12 @@ class SimpleAmmoniaCostModel(CostModelBaseClass):
         # -------------------------------CapEx Costs------------------------------
         scaling_factor_equipment = inputs["capex_scaling_exponent"]
         capex_scale_factor = scaling_ratio**scaling_factor_equipment
+        scaled_cepci_ratio = cepci_ratio * capex_scale_factor
 
-        capex_air_separation_cryogenic = (
-            model_year_CEPCI / equation_year_CEPCI * 22506100 * capex_scale_factor
-        )
-        capex_haber_bosch = model_year_CEPCI / equation_year_CEPCI * 18642800 * capex_scale_factor
-        capex_boiler = model_year_CEPCI / equation_year_CEPCI * 7069100 * capex_scale_factor
-        capex_cooling_tower = model_year_CEPCI / equation_year_CEPCI * 4799200 * capex_scale_factor
+        capex_air_separation_cryogenic = 22506100 * scaled_cepci_ratio
+        capex_haber_bosch = 18642800 * scaled_cepci_ratio
+        capex_boiler = 7069100 * scaled_cepci_ratio
+        capex_cooling_tower = 4799200 * scaled_cepci_ratio
         capex_direct = (
             capex_air_separation_cryogenic + capex_haber_bosch + capex_boiler + capex_cooling_tower
         )
@@ -212,8 +215,7 @@ class SimpleAmmoniaCostModel(CostModelBaseClass):
         labor_cost = 57 * 50 * 2080 * scaling_ratio**scaling_factor_labor
         general_administration_cost = labor_cost * 0.2
         property_tax_insurance = capex_total * 0.02
-        maintenance_cost = capex_direct * 0.005 * scaling_ratio**scaling_factor_equipment
-        land_cost = 2500000 * capex_scale_factor
+        maintenance_cost = capex_direct * 0.005 * capex_scale_factor
         total_fixed_operating_cost = (
             land_cost
             + labor_cost
@@ -224,35 +226,20 @@ class SimpleAmmoniaCostModel(CostModelBaseClass):
 
         # -------------------------------Feedstock Costs------------------------------
         H2_cost_in_startup_year = (
-            inputs["LCOH"]
-            * config.hydrogen_consumption
-            * config.plant_capacity_kgpy
-            * config.plant_capacity_factor
+            inputs["LCOH"] * config.hydrogen_consumption * ammonia_production_kgpy
         )
         energy_cost_in_startup_year = (
-            config.electricity_cost
-            * config.electricity_consumption
-            * config.plant_capacity_kgpy
-            * config.plant_capacity_factor
+            config.electricity_cost * config.electricity_consumption * ammonia_production_kgpy
         )
         non_energy_cost_in_startup_year = (
-            (
-                (config.cooling_water_cost * config.cooling_water_consumption)
-                + (config.iron_based_catalyst_cost * config.iron_based_catalyst_consumption)
-            )
-            * config.plant_capacity_kgpy
-            * config.plant_capacity_factor
-        )
+            (config.cooling_water_cost * config.cooling_water_consumption)
+            + (config.iron_based_catalyst_cost * config.iron_based_catalyst_consumption)
+        ) * ammonia_production_kgpy
         variable_cost_in_startup_year = (
             energy_cost_in_startup_year + non_energy_cost_in_startup_year
         )
         # -------------------------------Byproduct Costs------------------------------
-        credits_byproduct = (
-            config.oxygen_cost
-            * config.oxygen_byproduct
-            * config.plant_capacity_kgpy
-            * config.plant_capacity_factor
-        )
+        credits_byproduct = config.oxygen_cost * config.oxygen_byproduct * ammonia_production_kgpy
 
         # Set outputs
         outputs["capex_air_separation_cryogenic"] = capex_air_separation_cryogenic
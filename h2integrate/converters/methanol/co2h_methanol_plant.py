@@ -70,8 +70,8 @@ class CO2HMethanolPlantPerformanceModel(MethanolPerformanceBaseClass):
 
         # Set up feedstock supply inputs - can be replaced by connections
         meoh_cap = self.config.plant_capacity_kgpy
-        meoh_max_out = np.ones(n_timesteps) * meoh_cap / n_timesteps
-        self.add_input("meoh_syn_cat_in", units="ft**3/yr", val=syn_ratio * np.sum(meoh_max_out))
+        meoh_max_out = meoh_cap / n_timesteps
+        self.add_input("meoh_syn_cat_in", units="ft**3/yr", val=syn_ratio * meoh_cap)
         self.add_input("ng_in", shape=n_timesteps, units="kg/h", val=ng_ratio * meoh_max_out)
         self.add_input("co2_in", shape=n_timesteps, units="kg/h", val=co2_ratio * meoh_max_out)
         self.add_input("hydrogen_in", shape=n_timesteps, units="kg/h", val=h2_ratio * meoh_max_out)
@@ -99,23 +99,22 @@ class CO2HMethanolPlantPerformanceModel(MethanolPerformanceBaseClass):
         co2_ratio = inputs["co2_consume_ratio"]
         h2_ratio = inputs["h2_consume_ratio"]
         elec_ratio = inputs["elec_consume_ratio"]
-        meoh_from_syn = np.ones(n_timesteps) * syn_in / syn_ratio / n_timesteps
+        meoh_from_syn = syn_in / syn_ratio / n_timesteps
         meoh_from_ng = ng_in / ng_ratio
         meoh_from_co2 = co2_in / co2_ratio
         meoh_from_h2 = h2_in / h2_ratio
         meoh_from_elec = elec_in / elec_ratio
 
-        # Limiting methanol production per hour
-        meoh_prod = np.minimum.reduce(
-            [meoh_from_syn, meoh_from_ng, meoh_from_co2, meoh_from_h2, meoh_from_elec]
-        )
-        meoh_cap = np.ones(n_timesteps) * inputs["plant_capacity_kgpy"] / n_timesteps
-        meoh_prod = np.minimum.reduce([meoh_prod, meoh_cap])
+        # Limiting methanol production per hour, the annual limits are broadcast to each timestep
+        meoh_prod = np.minimum.reduce([meoh_from_ng, meoh_from_co2, meoh_from_h2, meoh_from_elec])
+        meoh_cap = inputs["plant_capacity_kgpy"] / n_timesteps
+        meoh_prod = np.minimum(np.minimum(meoh_prod, meoh_from_syn), meoh_cap)
 
         # Parse outputs
         outputs["methanol_out"] = meoh_prod
-        outputs["total_methanol_produced"] = np.sum(meoh_prod)
-        outputs["meoh_syn_cat_consume"] = np.sum(meoh_prod) * syn_ratio
+        total_meoh_prod = np.sum(meoh_prod)
+        outputs["total_methanol_produced"] = total_meoh_prod
+        outputs["meoh_syn_cat_consume"] = total_meoh_prod * syn_ratio
         outputs["ng_consume"] = meoh_prod * ng_ratio
         outputs["co2_consume"] = meoh_prod * co2_ratio
         outputs["hydrogen_consume"] = meoh_prod * h2_ratio
@@ -282,33 +281,34 @@ class CO2HMethanolPlantFinanceModel(MethanolFinanceBaseClass):
         )
 
     def compute(self, inputs, outputs):
-        kgph = inputs["methanol_out"]
+        # annual methanol production, the denominator of every levelized cost
+        total_meoh_prod = np.sum(inputs["methanol_out"])
 
         lcoe = inputs["LCOE"]
         elec = inputs["electricity_consume"]
         elec_cost = lcoe * np.sum(elec)
-        lcom_elec = elec_cost / np.sum(kgph)
+        lcom_elec = elec_cost / total_meoh_prod
         outputs["LCOM_elec"] = lcom_elec
 
         lcoh = inputs["LCOH"]
         h2 = inputs["hydrogen_consume"]
         h2_cost = lcoh * np.sum(h2)
-        lcom_h2 = h2_cost / np.sum(kgph)
+        lcom_h2 = h2_cost / total_meoh_prod
         outputs["LCOM_h2"] = lcom_h2
 
         lcom_capex = (
             inputs["CapEx"]
             * inputs["fixed_charge_rate"]
             * inputs["tasc_toc_multiplier"]
-            / np.sum(kgph)
+            / total_meoh_prod
         )
-        lcom_fopex = inputs["Fixed_OpEx"] / np.sum(kgph)
-        lcom_vopex = inputs["Variable_OpEx"] / np.sum(kgph)
+        lcom_fopex = inputs["Fixed_OpEx"] / total_meoh_prod
+        lcom_vopex = inputs["Variable_OpEx"] / total_meoh_prod
         outputs["LCOM_meoh_capex"] = lcom_capex
         outputs["LCOM_meoh_fopex"] = lcom_fopex
 
         meoh_syn_cat_cost = inputs["meoh_syn_cat_cost"]
-        lcom_meoh_syn_cat = meoh_syn_cat_cost / np.sum(kgph)
+        lcom_meoh_syn_cat = meoh_syn_cat_cost / total_meoh_prod
         outputs["LCOM_meoh_syn_cat"] = lcom_meoh_syn_cat
 
         # Correct LCOM_meoh_vopex which initially included catalyst
@@ -316,11 +316,11 @@ class CO2HMethanolPlantFinanceModel(MethanolFinanceBaseClass):
         outputs["LCOM_meoh_vopex"] = lcom_vopex
 
         ng_cost = inputs["ng_cost"]
-        lcom_ng = ng_cost / np.sum(kgph)
+        lcom_ng = ng_cost / total_meoh_prod
         outputs["LCOM_ng"] = lcom_ng
 
         co2_cost = inputs["co2_cost"]
-        lcom_co2 = co2_cost / np.sum(kgph)
+        lcom_co2 = co2_cost / total_meoh_prod
         outputs["LCOM_co2"] = lcom_co2
 
         lcom_meoh = lcom_capex + lcom_fopex + lcom_vopex + lcom_meoh_syn_cat
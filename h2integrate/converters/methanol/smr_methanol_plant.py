@@ -61,12 +61,9 @@ class SMRMethanolPlantPerformanceModel(MethanolPerformanceBaseClass):
 
         # Set up feedstock supply inputs - can be replaced by connections
         meoh_cap = self.config.plant_capacity_kgpy
-        meoh_max_out = np.ones(n_timesteps) * meoh_cap / n_timesteps
-        self.add_input("meoh_syn_cat_in", units="ft**3/yr", val=syn_ratio * np.sum(meoh_max_out))
-        self.add_input("meoh_atr_cat_in", units="ft**3/yr", val=atr_ratio * np.sum(meoh_max_out))
-        self.add_input(
-            "ng_in", shape=n_timesteps, units="kg/h", val=ng_ratio * np.sum(meoh_max_out)
-        )
+        self.add_input("meoh_syn_cat_in", units="ft**3/yr", val=syn_ratio * meoh_cap)
+        self.add_input("meoh_atr_cat_in", units="ft**3/yr", val=atr_ratio * meoh_cap)
+        self.add_input("ng_in", shape=n_timesteps, units="kg/h", val=ng_ratio * meoh_cap)
 
         # Set up feedstock consumption outputs
         self.add_output("meoh_syn_cat_consume", units="ft**3/yr")
@@ -85,24 +82,25 @@ class SMRMethanolPlantPerformanceModel(MethanolPerformanceBaseClass):
         syn_ratio = inputs["meoh_syn_cat_consume_ratio"]
         atr_ratio = inputs["meoh_atr_cat_consume_ratio"]
         ng_ratio = inputs["ng_consume_ratio"]
-        meoh_from_syn = np.ones(n_timesteps) * syn_in / syn_ratio / n_timesteps
-        meoh_from_atr = np.ones(n_timesteps) * atr_in / atr_ratio / n_timesteps
+        meoh_from_syn = syn_in / syn_ratio / n_timesteps
+        meoh_from_atr = atr_in / atr_ratio / n_timesteps
         meoh_from_ng = ng_in / ng_ratio
 
-        # Limiting methanol production per hour
-        meoh_prod = np.minimum.reduce([meoh_from_syn, meoh_from_atr, meoh_from_ng])
-        meoh_cap = np.ones(n_timesteps) * inputs["plant_capacity_kgpy"] / n_timesteps
-        meoh_prod = np.minimum.reduce([meoh_prod, meoh_cap])
+        # Limiting methanol production per hour, the annual limits are broadcast to each timestep
+        meoh_cap = inputs["plant_capacity_kgpy"] / n_timesteps
+        meoh_prod = np.minimum(np.minimum(meoh_from_ng, meoh_from_syn), meoh_from_atr)
+        meoh_prod = np.minimum(meoh_prod, meoh_cap)
 
         # Get co-product ratio0
         elec_ratio = inputs["elec_produce_ratio"]
 
         # Parse outputs
-        outputs["meoh_syn_cat_consume"] = np.sum(meoh_prod) * syn_ratio
-        outputs["meoh_atr_cat_consume"] = np.sum(meoh_prod) * atr_ratio
+        total_meoh_prod = np.sum(meoh_prod)
+        outputs["meoh_syn_cat_consume"] = total_meoh_prod * syn_ratio
+        outputs["meoh_atr_cat_consume"] = total_meoh_prod * atr_ratio
         outputs["ng_consume"] = meoh_prod * ng_ratio
         outputs["methanol_out"] = meoh_prod
-        outputs["total_methanol_produced"] = np.sum(meoh_prod)
+        outputs["total_methanol_produced"] = total_meoh_prod
         outputs["electricity_out"] = meoh_prod * elec_ratio
 
 
@@ -249,23 +247,24 @@ class SMRMethanolPlantFinanceModel(MethanolFinanceBaseClass):
         )
 
     def compute(self, inputs, outputs):
-        kgph = inputs["methanol_out"]
+        # annual methanol production, the denominator of every levelized cost
+        total_meoh_prod = np.sum(inputs["methanol_out"])
 
         lcom_capex = (
             inputs["CapEx"]
             * inputs["fixed_charge_rate"]
             * inputs["tasc_toc_multiplier"]
-            / np.sum(kgph)
+            / total_meoh_prod
         )
-        lcom_fopex = inputs["Fixed_OpEx"] / np.sum(kgph)
-        lcom_vopex = inputs["Variable_OpEx"] / np.sum(kgph)
+        lcom_fopex = inputs["Fixed_OpEx"] / total_meoh_prod
+        lcom_vopex = inputs["Variable_OpEx"] / total_meoh_prod
         outputs["LCOM_meoh_capex"] = lcom_capex
         outputs["LCOM_meoh_fopex"] = lcom_fopex
 
         meoh_syn_cat_cost = inputs["meoh_syn_cat_cost"]
         meoh_atr_cat_cost = inputs["meoh_atr_cat_cost"]
-        lcom_meoh_syn_cat = meoh_syn_cat_cost / np.sum(kgph)
-        lcom_meoh_atr_cat = meoh_atr_cat_cost / np.sum(kgph)
+        lcom_meoh_syn_cat = meoh_syn_cat_cost / total_meoh_prod
+        lcom_meoh_atr_cat = meoh_atr_cat_cost / total_meoh_prod
         outputs["LCOM_meoh_syn_cat"] = lcom_meoh_syn_cat
         outputs["LCOM_meoh_atr_cat"] = lcom_meoh_atr_cat
 
@@ -274,11 +273,11 @@ class SMRMethanolPlantFinanceModel(MethanolFinanceBaseClass):
         outputs["LCOM_meoh_vopex"] = lcom_vopex
 
         ng_cost = inputs["ng_cost"]
-        lcom_ng = ng_cost / np.sum(kgph)
+        lcom_ng = ng_cost / total_meoh_prod
         outputs["LCOM_ng"] = lcom_ng
 
         elec_rev = inputs["elec_revenue"]
-        lcom_elec = -elec_rev / np.sum(kgph)
+        lcom_elec = -elec_rev / total_meoh_prod
         outputs["LCOM_elec"] = lcom_elec
 
         lcom_meoh = lcom_capex + lcom_fopex + lcom_vopex + lcom_meoh_syn_cat + lcom_meoh_atr_cat
@@ -20,7 +20,7 @@ class NRELDeveloperAPISolarResourceBase(SolarResourceBaseAPIModel):
 
         # check interval to use for data download/load based on simulation timestep
         interval = self.dt / 60
-        if any(float(v) == float(interval) for v in self.config.valid_intervals):
+        if interval in self.config.valid_intervals:
             self.interval = int(interval)
         else:
             if interval > max(self.config.valid_intervals):
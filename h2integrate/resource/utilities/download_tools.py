@@ -3,6 +3,13 @@ import time
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
+
+
+# shared session so repeated downloads (e.g., site sweeps) reuse the same connection.
+# The adapter only pools connections; failed requests are retried by `download_from_api()`.
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
 
 
 def download_from_api(url, filename):
@@ -20,7 +27,7 @@ def download_from_api(url, filename):
     success = False
     while n_tries < 5:
         try:
-            r = requests.get(url)
+            r = _session.get(url)
             if r:
                 localfile = Path(filename).open("w+")
                 txt = r.text.replace("(Â°C)", "(C)").replace("(Â°)", "(deg)")
@@ -142,8 +142,9 @@ def get_nrel_developer_api_key(env_path=None):
     """
 
     # check if set as an environment variable
-    if os.getenv("NREL_API_KEY") is not None:
-        return os.getenv("NREL_API_KEY")
+    env_value = os.getenv("NREL_API_KEY")
+    if env_value is not None:
+        return env_value
 
     # check if set as a global variable
     global developer_nrel_gov_key
@@ -182,8 +183,9 @@ def get_nrel_developer_api_email(env_path=None):
     """
 
     # check if set as an environment variable
-    if os.getenv("NREL_API_EMAIL") is not None:
-        return os.getenv("NREL_API_EMAIL")
+    env_value = os.getenv("NREL_API_EMAIL")
+    if env_value is not None:
+        return env_value
 
     # check if set as a global variable
     global developer_nrel_gov_email
@@ -0,0 +1,29 @@
+import requests
+
+from h2integrate.resource.utilities import download_tools
+
+
+def test_download_from_api_server_error_attempts(subtests, monkeypatch, tmp_path):
+    attempted_urls = []
+
+    def get_server_error(url):
+        attempted_urls.append(url)
+        response = requests.Response()
+        response.status_code = 503
+        response.url = url
+        return response
+
+    monkeypatch.setattr(download_tools._session, "get", get_server_error)
+
+    url = "https://developer.nrel.gov/api/test"
+    filename = tmp_path / "resource.csv"
+    success = download_tools.download_from_api(url, filename)
+
+    with subtests.test("Download fails"):
+        assert success is False
+    with subtests.test("File not written"):
+        assert not filename.exists()
+    with subtests.test("Total number of attempts"):
+        assert len(attempted_urls) == 5
+    with subtests.test("Session adapter does not retry"):
+        assert download_tools._session.get_adapter(url).max_retries.total == 0
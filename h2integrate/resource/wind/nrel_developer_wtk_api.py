@@ -1,4 +1,6 @@
+import re
 import urllib.parse
+from io import StringIO
 from pathlib import Path
 
 import pandas as pd
@@ -13,6 +15,24 @@ from h2integrate.resource.utilities.nrel_developer_api_keys import (
 )
 
 
+WTK_BASE_URL = "https://developer.nrel.gov/api/wind-toolkit/v2/wind/wtk-download.csv?"
+
+# substrings of WTK unit strings that need to be replaced to be OpenMDAO-compatible
+WTK_UNIT_REPLACEMENTS = {"%": "percent", "degrees": "deg", "hour": "h"}
+_wtk_unit_pattern = re.compile("|".join(map(re.escape, WTK_UNIT_REPLACEMENTS)))
+
+# parts of WTK column names that are dropped when renaming: "air", "at ", and the
+# trailing units in parentheses
+_wtk_colname_drop_pattern = re.compile(r"air|at |\([^(]*$")
+
+
+def _format_wtk_units(units):
+    """Convert a WTK unit string to OpenMDAO-compatible units in a single pass."""
+    if units == "C":
+        return "degC"
+    return _wtk_unit_pattern.sub(lambda m: WTK_UNIT_REPLACEMENTS[m[0]], units)
+
+
 @define(kw_only=True)
 class WTKNRELDeveloperAPIConfig(ResourceBaseAPIConfig):
     """Configuration class to download wind resource data from
@@ -62,7 +82,7 @@ class WTKNRELDeveloperAPIWindResource(WindResourceBaseAPIModel):
 
         # check interval to use for data download/load based on simulation timestep
         interval = self.dt / 60
-        if any(float(v) == float(interval) for v in self.config.valid_intervals):
+        if interval in self.config.valid_intervals:
             self.interval = int(interval)
         else:
             if interval > max(self.config.valid_intervals):
@@ -122,8 +142,7 @@ class WTKNRELDeveloperAPIWindResource(WindResourceBaseAPIModel):
             "api_key": get_nrel_developer_api_key(),
             "email": get_nrel_developer_api_email(),
         }
-        base_url = "https://developer.nrel.gov/api/wind-toolkit/v2/wind/wtk-download.csv?"
-        url = base_url + urllib.parse.urlencode(input_data, True)
+        url = WTK_BASE_URL + urllib.parse.urlencode(input_data, True)
         return url
 
     def load_data(self, fpath):
@@ -148,8 +167,11 @@ class WTKNRELDeveloperAPIWindResource(WindResourceBaseAPIModel):
             Time information is found in the 'time' key.
         """
 
-        data = pd.read_csv(fpath, header=1)
-        header = pd.read_csv(fpath, nrows=1, header=None).values[0]
+        # read the site metadata line and the timeseries data in a single pass over the file
+        with Path(fpath).open("r") as f:
+            header_line = f.readline()
+            data = pd.read_csv(f, header=0)
+        header = pd.read_csv(StringIO(header_line), header=None).values[0]
         header_keys = header[0 : len(header) : 2]
         header_vals = header[1 : len(header) : 2]
         header_dict = dict(zip(header_keys, header_vals))
@@ -166,12 +188,7 @@ class WTKNRELDeveloperAPIWindResource(WindResourceBaseAPIModel):
 
         data, data_units = self.format_timeseries_data(data)
         # make units for data in openmdao-compatible units
-        data_units = {
-            k: v.replace("%", "percent").replace("degrees", "deg").replace("hour", "h")
-            for k, v in data_units.items()
-        }
-        data_units_temp = {k: "degC" for k, v in data_units.items() if v == "C"}
-        data_units.update(data_units_temp)
+        data_units = {k: _format_wtk_units(v) for k, v in data_units.items()}
         # convert data to standardized units
         data, data_units = self.compare_units_and_correct(data, data_units)
 
@@ -196,21 +213,24 @@ class WTKNRELDeveloperAPIWindResource(WindResourceBaseAPIModel):
                 data units in OpenMDAO compatible format.
         """
         time_cols = ["Year", "Month", "Day", "Hour", "Minute"]
-        data_cols_init = [c for c in data.columns.to_list() if c not in time_cols]
-        data_rename_mapper = {}
-        data_units = {}
-        for c in data_cols_init:
-            units = c.split("(")[-1].strip(")")
-            new_c = c.replace("air", "").replace("at ", "")
-            new_c = new_c.replace(f"({units})", "").strip().replace(" ", "_").replace("__", "_")
-
-            if "surface" in c:
-                new_c += "_0m"
-                new_c = new_c.replace("surface", "").replace("__", "").strip("_")
-            data_rename_mapper.update({c: new_c})
-            data_units.update({new_c: units})
+        data_cols_init = pd.Index([c for c in data.columns.to_list() if c not in time_cols])
+
+        # units are the text within the trailing parentheses of the column name
+        units = data_cols_init.str.split("(").str[-1].str.strip(")")
+        new_cols = (
+            data_cols_init.str.replace(_wtk_colname_drop_pattern, "", regex=True)
+            .str.strip()
+            .str.replace(r"\s+", "_", regex=True)
+        )
+        # surface-level data is labeled as a height of 0m
+        is_surface = data_cols_init.str.contains("surface", regex=False)
+        surface_cols = (new_cols + "_0m").str.replace(r"_*surface_*", "", regex=True)
+        new_cols = new_cols.where(~is_surface, surface_cols)
+
+        data_rename_mapper = dict(zip(data_cols_init, new_cols))
+        data_units = dict(zip(new_cols, units))
         data = data.rename(columns=data_rename_mapper)
-        data_dict = {c: data[c].astype(float).values for x, c in data_rename_mapper.items()}
-        data_time_dict = {c.lower(): data[c].astype(float).values for c in time_cols}
+        data_dict = {c: data[c].to_numpy(dtype=float) for c in data_rename_mapper.values()}
+        data_time_dict = {c.lower(): data[c].to_numpy(dtype=float) for c in time_cols}
         data_dict.update(data_time_dict)
         return data_dict, data_units
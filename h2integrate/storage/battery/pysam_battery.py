@@ -1,4 +1,5 @@
-from dataclasses import asdict, dataclass
+import warnings
+from dataclasses import dataclass
 from collections.abc import Sequence
 
 import numpy as np
@@ -22,8 +23,8 @@ class BatteryOutputs:
     n_cycles: Sequence
     P_chargeable: Sequence
     P_dischargeable: Sequence
-    unmet_demand: list[float]
-    unused_commodity: list[float]
+    unmet_demand: Sequence
+    unused_commodity: Sequence
 
     """
     Container for simulated outputs from the `BatteryStateful` and H2I dispatch models.
@@ -39,8 +40,8 @@ class BatteryOutputs:
         P_chargeable (Sequence): Maximum estimated chargeable power [kW] per timestep.
         P_dischargeable (Sequence): Maximum estimated dischargeable power [kW] per timestep.
 
-        unmet_demand (list[float]): Unmet demand [kW] per timestep.
-        unused_commodity (list[float]): Unused available commodity [kW] per timestep.
+        unmet_demand (Sequence): Unmet demand [kW] per timestep.
+        unused_commodity (Sequence): Unused available commodity [kW] per timestep.
     """
 
     def __init__(self, n_timesteps, n_control_window):
@@ -56,16 +57,26 @@ class BatteryOutputs:
             "P_dischargeable",
         ]
         for attr in self.stateful_attributes:
-            setattr(self, attr, [0.0] * n_timesteps)
+            setattr(self, attr, np.zeros(n_timesteps))
 
         self.dispatch_lifecycles_per_control_window = [None] * int(n_timesteps / n_control_window)
 
         self.component_attributes = ["unmet_demand", "unused_commodity"]
         for attr in self.component_attributes:
-            setattr(self, attr, [0.0] * n_timesteps)
+            setattr(self, attr, np.zeros(n_timesteps))
 
     def export(self):
-        return asdict(self)
+        """Return the stored outputs as a dictionary.
+
+        The arrays are returned by reference rather than deep-copied, so copy them before
+        modifying the returned values.
+        """
+        attrs = [
+            *self.stateful_attributes,
+            *self.component_attributes,
+            "dispatch_lifecycles_per_control_window",
+        ]
+        return {attr: getattr(self, attr) for attr in attrs}
 
 
 @define(kw_only=True)
@@ -295,6 +306,27 @@ class PySAMBatteryPerformanceModel(BatteryPerformanceBaseClass):
         # Setup outputs for the battery model to be stored during the compute method
         self.outputs = BatteryOutputs(n_timesteps=n_timesteps, n_control_window=n_control_window)
 
+        # Find the stateful outputs that can be scraped from the PySAM model modules `StatePack`
+        # and `StateCell`. This checks the module types because the values are not assigned
+        # until the model has been executed.
+        self.pysam_stateful_attributes = [
+            attr
+            for attr in self.outputs.stateful_attributes
+            if hasattr(type(self.system_model.StatePack), attr)
+            or hasattr(type(self.system_model.StateCell), attr)
+        ]
+        missing_attributes = [
+            attr
+            for attr in self.outputs.stateful_attributes
+            if attr not in self.pysam_stateful_attributes
+        ]
+        if missing_attributes:
+            warnings.warn(
+                f"Battery outputs {missing_attributes} are not available from the PySAM "
+                "BatteryStateful model and will not be stored in the battery outputs."
+            )
+            self.outputs.stateful_attributes = self.pysam_stateful_attributes
+
         # create inputs for pyomo control model
         if "tech_to_dispatch_connections" in self.options["plant_config"]:
             # get technology group name
@@ -393,11 +425,9 @@ class PySAMBatteryPerformanceModel(BatteryPerformanceBaseClass):
                 time_step_duration=self.dt_hr,
                 control_variable=self.config.control_variable,
             )
-            n_time_steps = len(inputs["electricity_demand"])
-
             # determine battery discharge
             self.outputs.P = battery_power
-            battery_power_out = [np.max([0, battery_power[i]]) for i in range(n_time_steps)]
+            battery_power_out = np.maximum(0, battery_power)
 
             # calculate combined power out from inflow source and battery (note: battery_power is
             # negative when charging)
@@ -407,17 +437,15 @@ class PySAMBatteryPerformanceModel(BatteryPerformanceBaseClass):
             total_power_out = np.minimum(inputs["electricity_demand"], combined_power_out)
 
             # determine how much of the inflow electricity was unused
-            self.outputs.unused_commodity = [
-                np.max([0, combined_power_out[i] - inputs["electricity_demand"][i]])
-                for i in range(n_time_steps)
-            ]
+            self.outputs.unused_commodity = np.maximum(
+                0, combined_power_out - inputs["electricity_demand"]
+            )
             unused_commodity = self.outputs.unused_commodity
 
             # determine how much demand was not met
-            self.outputs.unmet_demand = [
-                np.max([0, inputs["electricity_demand"][i] - combined_power_out[i]])
-                for i in range(n_time_steps)
-            ]
+            self.outputs.unmet_demand = np.maximum(
+                0, inputs["electricity_demand"] - combined_power_out
+            )
             unmet_demand = self.outputs.unmet_demand
 
         outputs["unmet_electricity_demand_out"] = unmet_demand
@@ -473,11 +501,16 @@ class PySAMBatteryPerformanceModel(BatteryPerformanceBaseClass):
         Notes:
             - SOC bounds may still be exceeded slightly due to PySAM internal dynamics.
             - self.outputs.stateful_attributes are updated only if the attribute exists
-            in StatePack or StateCell.
+            in StatePack or StateCell (see self.pysam_stateful_attributes set in setup()).
             - self.outputs.component_attributes (e.g., unmet_demand) are not modified here;
             they are populated in compute(), unless an external dispatcher manages them.
         """
 
+        # the per-step control input and battery states are accessed directly on their PySAM
+        # variable groups, which avoids searching every group by name as `value()` does
+        controls = self.system_model.Controls
+        state_pack = self.system_model.StatePack
+
         # Loop through the provided input power/current (decided by control_variable)
         self.system_model.value("dt_hr", time_step_duration)
 
@@ -488,32 +521,44 @@ class PySAMBatteryPerformanceModel(BatteryPerformanceBaseClass):
         # get constant battery parameters needed during all time steps
         soc_max = self.system_model.value("maximum_SOC") / 100.0
         soc_min = self.system_model.value("minimum_SOC") / 100.0
+        max_charge_rate = self.config.max_charge_rate
+        # power needed to move the full capacity in one time step
+        max_capacity_rate = self.config.max_capacity / self.dt_hr
+
+        # get the output arrays to write to during all time steps
+        stateful_outputs = [
+            (
+                state_pack if hasattr(type(state_pack), attr) else self.system_model.StateCell,
+                attr,
+                getattr(self.outputs, attr),
+            )
+            for attr in self.pysam_stateful_attributes
+        ]
+        component_outputs = [
+            (attr, getattr(self.outputs, attr)) for attr in self.outputs.component_attributes
+        ]
 
         for t, dispatch_command_t in enumerate(storage_dispatch_commands):
             # get storage SOC at time t
-            soc = self.system_model.value("SOC") / 100.0
+            soc = state_pack.SOC / 100.0
 
             # manually adjust the dispatch command based on SOC
             ## for when battery is withing set bounds
             # according to specs
-            max_chargeable_0 = self.config.max_charge_rate
+            max_chargeable_0 = max_charge_rate
             # according to simulation
-            max_chargeable_1 = np.maximum(0, -self.system_model.value("P_chargeable"))
+            max_chargeable_1 = np.maximum(0, -state_pack.P_chargeable)
             # according to soc
-            max_chargeable_2 = np.maximum(
-                0, (soc_max - soc) * self.config.max_capacity / self.dt_hr
-            )
+            max_chargeable_2 = np.maximum(0, (soc_max - soc) * max_capacity_rate)
             # compare all versions of max_chargeable
             max_chargeable = np.min([max_chargeable_0, max_chargeable_1, max_chargeable_2])
 
             # according to specs
-            max_dischargeable_0 = self.config.max_charge_rate
+            max_dischargeable_0 = max_charge_rate
             # according to simulation
-            max_dischargeable_1 = np.maximum(0, self.system_model.value("P_dischargeable"))
+            max_dischargeable_1 = np.maximum(0, state_pack.P_dischargeable)
             # according to soc
-            max_dischargeable_2 = np.maximum(
-                0, (soc - soc_min) * self.config.max_capacity / self.dt_hr
-            )
+            max_dischargeable_2 = np.maximum(0, (soc - soc_min) * max_capacity_rate)
             # compare all versions of max_dischargeable
             max_dischargeable = np.min(
                 [max_dischargeable_0, max_dischargeable_1, max_dischargeable_2]
@@ -529,25 +574,22 @@ class PySAMBatteryPerformanceModel(BatteryPerformanceBaseClass):
                 dispatch_command_t = 0.0
 
             # Set the input variable to the desired value
-            self.system_model.value(control_variable, dispatch_command_t)
+            setattr(controls, control_variable, dispatch_command_t)
 
             # Simulate the PySAM BatteryStateful model
             self.system_model.execute(0)
 
             # save outputs
-            storage_power_out_timesteps[t] = self.system_model.value("P")
-            soc_timesteps[t] = self.system_model.value("SOC")
+            storage_power_out_timesteps[t] = state_pack.P
+            soc_timesteps[t] = state_pack.SOC
 
             # Store outputs based on the outputs defined in `BatteryOutputs` above. The values are
             # scraped from the PySAM model modules `StatePack` and `StateCell`.
-            for attr in self.outputs.stateful_attributes:
-                if hasattr(self.system_model.StatePack, attr) or hasattr(
-                    self.system_model.StateCell, attr
-                ):
-                    getattr(self.outputs, attr)[sim_start_index + t] = self.system_model.value(attr)
-
-            for attr in self.outputs.component_attributes:
-                getattr(self.outputs, attr)[sim_start_index + t] = getattr(self, attr)
+            for group, attr, output in stateful_outputs:
+                output[sim_start_index + t] = getattr(group, attr)
+
+            for attr, output in component_outputs:
+                output[sim_start_index + t] = getattr(self, attr)
 
         return storage_power_out_timesteps, soc_timesteps
 
@@ -7,6 +7,7 @@ import pytest
 import openmdao.api as om
 
 from h2integrate.storage.battery.pysam_battery import (
+    BatteryOutputs,
     PySAMBatteryPerformanceModel,
     PySAMBatteryPerformanceModelConfig,
 )
@@ -262,6 +263,8 @@ def test_battery_initialization(subtests):
         assert battery.system_model is not None
     with subtests.test("battery attribute not None outputs"):
         assert battery.outputs is not None
+    with subtests.test("battery stateful outputs available from PySAM"):
+        assert battery.pysam_stateful_attributes == battery.outputs.stateful_attributes
 
     with subtests.test("battery mass"):
         # this test value does not match the value in test_battery.py in HOPP
@@ -269,3 +272,57 @@ def test_battery_initialization(subtests):
         # and in HOPP it's in the attrs_post_init function
         # suggest removing this subtest
         assert battery.system_model.ParamsPack.mass * 20000 == pytest.approx(3044540.0, 1e-3)
+
+
+def test_battery_missing_stateful_attribute(subtests, monkeypatch):
+    current_dir = Path(__file__).parent
+    tech_config_path = current_dir / "inputs" / "tech_config.yaml"
+    with tech_config_path.open() as file:
+        tech_config = yaml.safe_load(file)
+
+    # add an output that is not available from the PySAM BatteryStateful model
+    battery_outputs_init = BatteryOutputs.__init__
+
+    def battery_outputs_init_with_bogus_attribute(self, n_timesteps, n_control_window):
+        battery_outputs_init(self, n_timesteps, n_control_window)
+        self.stateful_attributes.append("bogus_attribute")
+        self.bogus_attribute = np.zeros(n_timesteps)
+
+    monkeypatch.setattr(BatteryOutputs, "__init__", battery_outputs_init_with_bogus_attribute)
+
+    battery = PySAMBatteryPerformanceModel(
+        plant_config={"plant": {"simulation": {"dt": 3600, "n_timesteps": 24}}},
+        tech_config=tech_config["technologies"]["battery"],
+    )
+
+    with pytest.warns(UserWarning, match="bogus_attribute"):
+        battery.setup()
+
+    with subtests.test("missing attribute not resolved from PySAM"):
+        assert "bogus_attribute" not in battery.pysam_stateful_attributes
+    with subtests.test("available attributes still resolved from PySAM"):
+        assert "SOC" in battery.pysam_stateful_attributes
+    with subtests.test("missing attribute skipped in export"):
+        exported = battery.outputs.export()
+        assert "bogus_attribute" not in exported
+        assert "SOC" in exported
+
+
+def test_battery_outputs_export(subtests):
+    battery_outputs = BatteryOutputs(n_timesteps=24, n_control_window=12)
+    battery_outputs.SOC[0] = 50.0
+
+    exported = battery_outputs.export()
+
+    with subtests.test("exported keys"):
+        assert set(exported) == {
+            *battery_outputs.stateful_attributes,
+            *battery_outputs.component_attributes,
+            "dispatch_lifecycles_per_control_window",
+        }
+    with subtests.test("exported arrays are not copied"):
+        assert exported["SOC"] is battery_outputs.SOC
+    with subtests.test("exported timeseries length"):
+        assert len(exported["P"]) == 24
+    with subtests.test("exported control windows"):
+        assert len(exported["dispatch_lifecycles_per_control_window"]) == 2
@@ -7,6 +7,19 @@ from h2integrate.core.validators import contains
 from h2integrate.core.model_baseclasses import CostModelBaseClass
 
 
+# cost coefficients (b0, b1, b2, b3, b4) for each cost, one row per cost
+MCH_COST_COEFFS = np.array(
+    [
+        # overnight capital cost coefficients
+        [54706639.43, 147074.25, 588779.05, 20825.39, 10.31],
+        # fixed O&M cost coefficients
+        [3419384.73, 3542.79, 13827.02, 61.22, 0.0],
+        # variable O&M cost coefficients
+        [711326.78, 1698.76, 6844.86, 36.04, 376.31],
+    ]
+)
+
+
 @define(kw_only=True)
 class MCHTOLStorageCostModelConfig(BaseConfig):
     """Config class for MCHTOLStorageCostModel
@@ -157,8 +170,7 @@ class MCHTOLStorageCostModel(CostModelBaseClass):
 
         # calculate the annual amount of hydrogen stored
         h2_charge_discharge = np.diff(hydrogen_storage_soc_kg, prepend=False)
-        h2_charged_idx = np.argwhere(h2_charge_discharge > 0).flatten()
-        annual_h2_stored_kg = sum([h2_charge_discharge[i] for i in h2_charged_idx])
+        annual_h2_stored_kg = np.sum(h2_charge_discharge[h2_charge_discharge > 0])
 
         # convert annual hydrogen stored to metric tonnes/day
         annual_h2_stored_tpy = units.convert_units(
@@ -183,15 +195,12 @@ class MCHTOLStorageCostModel(CostModelBaseClass):
         # maximum storage capacity [metric tonnes]
         self.Ms = h2_storage_capacity_tons[0]
 
-        # overnight capital cost coefficients
-        occ_coeff = (54706639.43, 147074.25, 588779.05, 20825.39, 10.31)
-
-        # fixed O&M cost coefficients
-        foc_coeff = (3419384.73, 3542.79, 13827.02, 61.22, 0.0)
+        # cost function terms, ordered to match the coefficients (b0, b1, b2, b3, b4)
+        self.cost_features = np.array([1.0, self.Hc, self.Dc, self.Ms, self.As])
 
-        # variable O&M cost coefficients
-        voc_coeff = (711326.78, 1698.76, 6844.86, 36.04, 376.31)
+        # evaluate all three cost functions with a single matrix-vector product
+        capex, fixed_om, variable_om = MCH_COST_COEFFS @ self.cost_features
 
-        outputs["CapEx"] = self.calc_cost_value(*occ_coeff)
-        outputs["OpEx"] = self.calc_cost_value(*foc_coeff)
-        outputs["VarOpEx"] = self.calc_cost_value(*voc_coeff)
+        outputs["CapEx"] = capex
+        outputs["OpEx"] = fixed_om
+        outputs["VarOpEx"] = variable_om
@@ -103,21 +103,10 @@ class StorageAutoSizingModel(om.ExplicitComponent):
         commodity_production = inputs[f"{commodity_name}_in"]
 
         # TODO: SOC is just an absolute value and is not a percentage. Ideally would calculate as shortfall in future.
-        commodity_storage_soc = []
-        for j in range(len(commodity_production)):
-            if j == 0:
-                commodity_storage_soc.append(commodity_production[j] - commodity_demand)
-            else:
-                commodity_storage_soc.append(
-                    commodity_storage_soc[j - 1] + commodity_production[j] - commodity_demand
-                )
-
-        minimum_soc = np.min(commodity_storage_soc)
-
-        # adjust soc so it's not negative.
-        if minimum_soc < 0:
-            commodity_storage_soc = [x + np.abs(minimum_soc) for x in commodity_storage_soc]
+        commodity_storage_soc = np.cumsum(commodity_production - commodity_demand)
 
+        # the storage capacity is the range of the soc, which does not change if the soc is
+        # shifted so that it's not negative
         commodity_storage_capacity_kg = np.max(commodity_storage_soc) - np.min(
             commodity_storage_soc
         )
@@ -0,0 +1,61 @@
+import openmdao.api as om
+from pytest import approx, fixture
+
+from h2integrate.storage.simple_storage_auto_sizing import StorageAutoSizingModel
+
+
+@fixture
+def plant_config():
+    plant_config_dict = {
+        "plant": {
+            "plant_life": 30,
+            "simulation": {
+                "n_timesteps": 6,
+            },
+        },
+    }
+    return plant_config_dict
+
+
+def run_storage_auto_sizing(plant_config, demand_profile):
+    tech_config_dict = {
+        "model_inputs": {
+            "performance_parameters": {
+                "commodity_name": "hydrogen",
+                "commodity_units": "kg/h",
+                "demand_profile": demand_profile,
+            }
+        }
+    }
+
+    prob = om.Problem()
+    comp = StorageAutoSizingModel(
+        plant_config=plant_config,
+        tech_config=tech_config_dict,
+        driver_config={},
+    )
+    prob.model.add_subsystem("sys", comp)
+    prob.setup()
+    prob.set_val("sys.hydrogen_in", [4.0, 0.0, 2.0, 6.0, 0.0, 0.0], units="kg/h")
+    prob.run_model()
+    return prob
+
+
+def test_storage_auto_sizing_mean_demand(plant_config, subtests):
+    # no demand is given, so the storage is sized to supply the mean production of 2 kg/h
+    prob = run_storage_auto_sizing(plant_config, 0.0)
+
+    with subtests.test("max_capacity"):
+        assert prob.get_val("sys.max_capacity", units="kg")[0] == approx(4.0)
+    with subtests.test("max_charge_rate"):
+        assert prob.get_val("sys.max_charge_rate", units="kg/h")[0] == approx(6.0)
+
+
+def test_storage_auto_sizing_demand_profile(plant_config, subtests):
+    # storage is sized with the demand of each timestep, giving an soc of [4, 2, 2, 6, 4, 0]
+    prob = run_storage_auto_sizing(plant_config, [0.0, 2.0, 2.0, 2.0, 2.0, 4.0])
+
+    with subtests.test("max_capacity"):
+        assert prob.get_val("sys.max_capacity", units="kg")[0] == approx(6.0)
+    with subtests.test("max_charge_rate"):
+        assert prob.get_val("sys.max_charge_rate", units="kg/h")[0] == approx(6.0)